@@ -36,10 +36,14 @@ class MultitaskMultivariateNormal(MultivariateNormal):
         self._output_shape = mean.shape
         # TODO: Instead of transpose / view operations, use a PermutationLazyTensor (see #539) to handle interleaving
         self._interleaved = interleaved
+        self._noninterleaved_mean = None
         if self._interleaved:
             mean_mvn = mean.reshape(*mean.shape[:-2], -1)
         else:
             mean_mvn = mean.transpose(-1, -2).reshape(*mean.shape[:-2], -1)
+            # Hold on to the n x t mean, so that `mean` doesn't have to transpose (and copy) it back
+            if torch.is_tensor(mean):
+                self._noninterleaved_mean = mean.contiguous()
         super().__init__(mean=mean_mvn, covariance_matrix=covariance_matrix, validate_args=validate_args)
 
     @property
@@ -71,6 +75,8 @@ class MultitaskMultivariateNormal(MultivariateNormal):
         return cls(mean=mean, covariance_matrix=covar_lazy, interleaved=False)
 
     def expand(self, batch_size):
+        if torch.Size(batch_size) == self.batch_shape:
+            return self
         new_mean = self.mean.expand(torch.Size(batch_size) + self.mean.shape[-2:])
         new_covar = self._covar.expand(torch.Size(batch_size) + self._covar.shape[-2:])
         res = self.__class__(new_mean, new_covar, interleaved=self._interleaved)
@@ -94,6 +100,8 @@ class MultitaskMultivariateNormal(MultivariateNormal):
 
     @property
     def mean(self):
+        if self._noninterleaved_mean is not None:
+            return self._noninterleaved_mean
         mean = super().mean
         if not self._interleaved:
             # flip shape of last two dimensions
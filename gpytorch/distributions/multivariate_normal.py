@@ -1,17 +1,26 @@
 #!/usr/bin/env python3
 
 import math
+import weakref
+from functools import lru_cache
 
 import torch
 from torch.distributions import MultivariateNormal as TMultivariateNormal
 from torch.distributions.kl import register_kl
-from torch.distributions.utils import _standard_normal, lazy_property
+from torch.distributions.utils import lazy_property
 
 from .. import settings
-from ..lazy import LazyTensor, lazify, delazify
+from ..lazy import CholLazyTensor, LazyTensor, NonLazyTensor, ZeroLazyTensor, lazify, delazify
 from .distribution import Distribution
 from ..utils.broadcasting import _mul_broadcast_shape
 
+_LOG_2PI = math.log(2 * math.pi)
+
+
+@lru_cache(maxsize=64)
+def _neg_half_d_log2pi(d):
+    return -0.5 * d * _LOG_2PI
+
 
 class _MultivariateNormalBase(TMultivariateNormal, Distribution):
     """
@@ -36,6 +45,8 @@ class _MultivariateNormalBase(TMultivariateNormal, Distribution):
             self.loc = mean
             self._covar = covariance_matrix
             self.__unbroadcasted_scale_tril = None
+            self.__covariance_matrix = None
+            self.__covariance_matrix_ref = None
             self._validate_args = validate_args
             batch_shape, event_shape = self.loc.shape[:-1], self.loc.shape[-1:]
             # TODO: Integrate argument validation for LazyTensors into torch.distribution validation logic
@@ -59,6 +70,8 @@ class _MultivariateNormalBase(TMultivariateNormal, Distribution):
             self.__unbroadcasted_scale_tril = ust
 
     def expand(self, batch_size):
+        if torch.Size(batch_size) == self.batch_shape:
+            return self
         new_loc = self.loc.expand(torch.Size(batch_size) + self.loc.shape[-1:])
         new_covar = self._covar.expand(torch.Size(batch_size) + self._covar.shape[-2:])
         res = self.__class__(new_loc, new_covar)
@@ -75,22 +88,44 @@ class _MultivariateNormalBase(TMultivariateNormal, Distribution):
                 the confidence region.
 
         """
-        std2 = self.stddev.mul_(2)
+        std2 = self.stddev.mul(2)
         mean = self.mean
         return mean.sub(std2), mean.add(std2)
 
-    @lazy_property
+    @property
     def covariance_matrix(self):
+        if self.islazy and settings.memory_efficient_covariance.on():
+            # Only keep a weak reference to the dense matrix, so that it is freed once callers drop it
+            covar = self.__covariance_matrix_ref() if self.__covariance_matrix_ref is not None else None
+            if covar is None:
+                if isinstance(self._covar, CholLazyTensor):
+                    # Rebuild the matrix from its (already stored) Cholesky factor
+                    root = self._covar.root.evaluate()
+                    covar = root.matmul(root.transpose(-1, -2))
+                else:
+                    covar = self._covar.evaluate()
+                self.__covariance_matrix_ref = weakref.ref(covar)
+            return covar
+
+        if self.__covariance_matrix is None:
+            if self.islazy:
+                self.__covariance_matrix = self._covar.evaluate()
+            else:
+                self.__covariance_matrix = super().covariance_matrix
+        return self.__covariance_matrix
+
+    @covariance_matrix.setter
+    def covariance_matrix(self, covar):
         if self.islazy:
-            return self._covar.evaluate()
+            raise NotImplementedError("Cannot set covariance_matrix for lazy MVN distributions")
         else:
-            return super().covariance_matrix
+            self.__covariance_matrix = covar
 
     def get_base_samples(self, sample_shape=torch.Size()):
         """Get i.i.d. standard Normal samples (to be used with rsample(base_samples=base_samples))"""
         with torch.no_grad():
             shape = self._extended_shape(sample_shape)
-            base_samples = _standard_normal(shape, dtype=self.loc.dtype, device=self.loc.device)
+            base_samples = torch.empty(shape, dtype=self.loc.dtype, device=self.loc.device).normal_()
         return base_samples
 
     @lazy_property
@@ -113,21 +148,19 @@ class _MultivariateNormalBase(TMultivariateNormal, Distribution):
         mean, covar = self.loc, self.lazy_covariance_matrix
         diff = value - mean
 
-        # Repeat the covar to match the batch shape of diff
+        # Expand the covar to match the batch shape of diff
         if diff.shape[:-1] != covar.batch_shape:
             if len(diff.shape[:-1]) < len(covar.batch_shape):
                 diff = diff.expand(covar.shape[:-1])
             else:
-                padded_batch_shape = (*(1 for _ in range(diff.dim() + 1 - covar.dim())), *covar.batch_shape)
-                covar = covar.repeat(
-                    *(diff_size // covar_size for diff_size, covar_size in zip(diff.shape[:-1], padded_batch_shape)),
-                    1, 1
-                )
+                covar = covar.expand(*diff.shape[:-1], *covar.matrix_shape)
 
         # Get log determininat and first part of quadratic form
         inv_quad, logdet = covar.inv_quad_logdet(inv_quad_rhs=diff.unsqueeze(-1), logdet=True)
 
-        res = -0.5 * sum([inv_quad, logdet, diff.size(-1) * math.log(2 * math.pi)])
+        res = inv_quad.add_(logdet)
+        res.mul_(-0.5)
+        res.add_(_neg_half_d_log2pi(diff.size(-1)))
         return res
 
     def rsample(self, sample_shape=torch.Size(), base_samples=None):
@@ -151,22 +184,35 @@ class _MultivariateNormalBase(TMultivariateNormal, Distribution):
             # Determine what the appropriate sample_shape parameter is
             sample_shape = base_samples.shape[: base_samples.dim() - self.loc.dim()]
 
-            # Reshape samples to be batch_size x num_dim x num_samples
-            # or num_bim x num_samples
+            # Reshape samples to be num_samples x batch_size x num_dim
+            # or num_samples x num_dim
             base_samples = base_samples.view(-1, *self.loc.shape)
-            base_samples = base_samples.permute(*tuple(range(1, self.loc.dim() + 1)), 0)
 
             # Now reparameterize those base samples
             covar_root = covar.root_decomposition().root
             # If necessary, adjust base_samples for rank of root decomposition
-            if covar_root.shape[-1] < base_samples.shape[-2]:
-                base_samples = base_samples[..., : covar_root.shape[-1], :]
-            elif covar_root.shape[-1] > base_samples.shape[-2]:
+            if covar_root.shape[-1] < base_samples.shape[-1]:
+                base_samples = base_samples[..., : covar_root.shape[-1]]
+            elif covar_root.shape[-1] > base_samples.shape[-1]:
                 raise RuntimeError("Incompatible dimension of `base_samples`")
-            res = covar_root.matmul(base_samples) + self.loc.unsqueeze(-1)
 
-            # Permute and reshape new samples to be original size
-            res = res.permute(-1, *tuple(range(self.loc.dim()))).contiguous()
+            if isinstance(covar_root, LazyTensor) and not isinstance(covar_root, NonLazyTensor):
+                # Structured roots have to be applied to batch_size x num_dim x num_samples tensors
+                base_samples = base_samples.permute(*tuple(range(1, self.loc.dim() + 1)), 0)
+                res = covar_root.matmul(base_samples).permute(-1, *tuple(range(self.loc.dim()))).contiguous()
+            else:
+                # Dense roots can be applied to the samples in their current layout (no permute/copy needed).
+                # Each sample is treated as a row vector so that it is paired with its own batch's root
+                covar_root = delazify(covar_root).transpose(-1, -2)
+                base_samples = base_samples.unsqueeze(-2)
+                if settings.bf16_sampling.on() and covar_root.is_cuda:
+                    res = base_samples.to(torch.bfloat16).matmul(covar_root.to(torch.bfloat16)).to(self.loc.dtype)
+                else:
+                    res = base_samples.matmul(covar_root)
+                res = res.squeeze(-2)
+
+            # Reshape new samples to be original size
+            res = res + self.loc
             res = res.view(sample_shape + self.loc.shape)
 
         return res
@@ -206,6 +252,12 @@ class _MultivariateNormalBase(TMultivariateNormal, Distribution):
             raise RuntimeError("Can only multiply by scalars")
         if other == 1:
             return self
+        if other == 0:
+            covar = self.lazy_covariance_matrix
+            return self.__class__(
+                mean=self.mean * other,
+                covariance_matrix=ZeroLazyTensor(*covar.shape, dtype=covar.dtype, device=covar.device),
+            )
         return self.__class__(mean=self.mean * other, covariance_matrix=self.lazy_covariance_matrix * (other ** 2))
 
     def __truediv__(self, other):
@@ -239,16 +291,43 @@ def kl_mvn_mvn(p_dist, q_dist):
 
     p_mean = p_dist.loc
     p_covar = p_dist.lazy_covariance_matrix
-    root_p_covar = p_covar.root_decomposition().root.evaluate()
-
     mean_diffs = p_mean - q_mean
+
+    # If both distributions share a covariance, the logdet and trace terms cancel
+    if p_covar is q_covar:
+        inv_quad_form, _ = q_covar.inv_quad_logdet(inv_quad_rhs=mean_diffs.unsqueeze(-1), logdet=False)
+        return 0.5 * inv_quad_form
+
+    p_root = p_covar.root_decomposition()
+    root_p_covar = p_root.root.evaluate()
+
     if isinstance(root_p_covar, LazyTensor):
         # right now this just catches if root_p_covar is a DiagLazyTensor,
         # but we may want to be smarter about this in the future
         root_p_covar = root_p_covar.evaluate()
-    inv_quad_rhs = torch.cat([mean_diffs.unsqueeze(-1), root_p_covar], -1)
-    logdet_p_covar = p_covar.logdet()
-    trace_plus_inv_quad_form, logdet_q_covar = q_covar.inv_quad_logdet(inv_quad_rhs=inv_quad_rhs, logdet=True)
+    if isinstance(p_root, CholLazyTensor):
+        # Reuse the Cholesky factor rather than computing a separate logdet
+        logdet_p_covar = p_root.logdet()
+    else:
+        logdet_p_covar = p_covar.logdet()
+
+    # LazyTensors with structured inv_quad_logdet overrides (e.g. DiagLazyTensor, BlockDiagLazyTensor) are
+    # left to those overrides
+    uses_default_inv_quad_logdet = type(q_covar).inv_quad_logdet is LazyTensor.inv_quad_logdet
+    if uses_default_inv_quad_logdet and (
+        settings.fast_computations.log_prob.off() or q_covar.size(-1) <= settings.max_cholesky_size.value()
+    ):
+        # With a Cholesky factor of q_covar, the trace and quadratic terms can be solved separately
+        # (reusing the factor), which avoids concatenating the right hand sides
+        q_chol = CholLazyTensor(q_covar.cholesky())
+        trace_term = q_chol.inv_quad(root_p_covar)
+        inv_quad_form, logdet_q_covar = q_chol.inv_quad_logdet(inv_quad_rhs=mean_diffs.unsqueeze(-1), logdet=True)
+        trace_plus_inv_quad_form = trace_term + inv_quad_form
+    else:
+        # A single inv_quad_logdet call (e.g. one batched CG run) is cheaper than separate calls
+        # for each set of right hand sides
+        inv_quad_rhs = torch.cat([mean_diffs.unsqueeze(-1), root_p_covar], -1)
+        trace_plus_inv_quad_form, logdet_q_covar = q_covar.inv_quad_logdet(inv_quad_rhs=inv_quad_rhs, logdet=True)
 
     # Compute the KL Divergence.
     res = 0.5 * sum([logdet_q_covar, logdet_p_covar.mul(-1), trace_plus_inv_quad_form, -float(mean_diffs.size(-1))])
@@ -99,6 +99,10 @@ class ConstantMulLazyTensor(LazyTensor):
         res = res * self.expanded_constant
         return res
 
+    def _mul_constant(self, other):
+        # Fold the constants together, rather than nesting ConstantMulLazyTensors
+        return self.__class__(self.base_lazy_tensor, self._constant * other)
+
     def _permute_batch(self, *dims):
         return self.__class__(
             self.base_lazy_tensor._permute_batch(*dims),
@@ -37,7 +37,11 @@ class SumLazyTensor(LazyTensor):
         return SumLazyTensor(*results)
 
     def _matmul(self, rhs):
-        return sum(lazy_tensor._matmul(rhs) for lazy_tensor in self.lazy_tensors)
+        # Accumulate from the first term (rather than with sum) to avoid an extra copy per MVM
+        res = self.lazy_tensors[0]._matmul(rhs)
+        for lazy_tensor in self.lazy_tensors[1:]:
+            res = res + lazy_tensor._matmul(rhs)
+        return res
 
     def _quad_form_derivative(self, left_vecs, right_vecs):
         return tuple(
@@ -51,7 +55,10 @@ class SumLazyTensor(LazyTensor):
         return self.__class__(*(lazy_tensor._sum_batch(dim) for lazy_tensor in self.lazy_tensors))
 
     def _t_matmul(self, rhs):
-        return sum(lazy_tensor._t_matmul(rhs) for lazy_tensor in self.lazy_tensors)
+        res = self.lazy_tensors[0]._t_matmul(rhs)
+        for lazy_tensor in self.lazy_tensors[1:]:
+            res = res + lazy_tensor._t_matmul(rhs)
+        return res
 
     def _transpose_nonbatch(self):
         lazy_tensors_t = [lazy_tensor.transpose(-1, -2) for lazy_tensor in self.lazy_tensors]
@@ -129,7 +129,7 @@ class ZeroLazyTensor(LazyTensor):
 
     @cached
     def evaluate(self):
-        return torch.zeros(*self.sizes)
+        return torch.zeros(*self.sizes, dtype=self.dtype, device=self.device)
 
     def inv_matmul(self, right_tensor, left_tensor=None):
         raise RuntimeError("ZeroLazyTensors are not invertible!")
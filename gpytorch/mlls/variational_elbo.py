@@ -1,8 +1,16 @@
 #!/usr/bin/env python3
 
 import torch
+from torch.distributions import Normal
 from .marginal_log_likelihood import MarginalLogLikelihood
 from .. import settings
+from ..priors import NormalPrior
+
+
+@torch.jit.script
+def _combine_terms(log_likelihood, kl_divergence, log_prior, added_loss):
+    # Scripted so that (on the GPU) the elementwise ops can be fused into a single kernel
+    return log_likelihood - kl_divergence + log_prior + added_loss
 
 
 class VariationalELBO(MarginalLogLikelihood):
@@ -42,19 +50,45 @@ class VariationalELBO(MarginalLogLikelihood):
             added_loss.add_(added_loss_term.loss())
             had_added_losses = True
 
+        log_prior = torch.zeros_like(log_likelihood)
+        # Priors (or groups of priors) may live on different devices or have different dtypes,
+        # so each log prob is accumulated separately rather than stacked
+        for prior_log_prob in self._prior_log_probs():
+            log_prior.add_(prior_log_prob)
+        log_prior = log_prior.div(self.num_data)
+
         if self.combine_terms:
-            res = log_likelihood - kl_divergence
-            for _, prior, closure, _ in self.named_priors():
-                res.add_(prior.log_prob(closure()).sum().div(self.num_data))
-            return res + added_loss
+            return _combine_terms(log_likelihood, kl_divergence, log_prior, added_loss)
         else:
-            log_prior = torch.zeros_like(log_likelihood)
-            for _, prior, closure, _ in self.named_priors():
-                log_prior.add_(prior.log_prob(closure()).sum())
             if had_added_losses:
-                return log_likelihood, kl_divergence, log_prior.div(self.num_data), added_loss
+                return log_likelihood, kl_divergence, log_prior, added_loss
+            else:
+                return log_likelihood, kl_divergence, log_prior
+
+    def _prior_log_probs(self):
+        """
+        Returns a list of scalar (summed) log probabilities of the registered priors.
+        The log probabilities of all :obj:`~gpytorch.priors.NormalPrior` priors (with the same dtype and device)
+        are computed with a single vectorized Normal log_prob call.
+        """
+        log_probs = []
+        normal_args = {}
+        for _, prior, closure, _ in self.named_priors():
+            # Subclasses of NormalPrior might override log_prob, so we only vectorize NormalPriors themselves
+            if type(prior) is NormalPrior:
+                value = prior.transform(closure())
+                loc, scale, value = torch.broadcast_tensors(prior.loc, prior.scale, value)
+                locs, scales, values = normal_args.setdefault((value.dtype, value.device), ([], [], []))
+                locs.append(loc.reshape(-1))
+                scales.append(scale.reshape(-1))
+                values.append(value.reshape(-1))
             else:
-                return log_likelihood, kl_divergence, log_prior.div(self.num_data)
+                log_probs.append(prior.log_prob(closure()).sum())
+
+        for locs, scales, values in normal_args.values():
+            normal = Normal(torch.cat(locs), torch.cat(scales), validate_args=False)
+            log_probs.append(normal.log_prob(torch.cat(values)).sum())
+        return log_probs
 
 
 class VariationalELBOEmpirical(VariationalELBO):
@@ -86,6 +120,6 @@ class VariationalELBOEmpirical(VariationalELBO):
         kl_divergence = kl_divergence.div(self.num_data)
 
         res = log_likelihood - kl_divergence
-        for _, prior, closure, _ in self.named_priors():
-            res.add_(prior.log_prob(closure()).sum().div(self.num_data))
+        for prior_log_prob in self._prior_log_probs():
+            res.add_(prior_log_prob.div(self.num_data))
         return res
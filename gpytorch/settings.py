@@ -352,6 +352,41 @@ class _use_eval_tolerance(_feature_flag):
     _state = False
 
 
+class bf16_sampling(_feature_flag):
+    """
+    Whether or not to use bfloat16 arithmetic when reparameterizing base samples with a (dense) covariance root
+    in :meth:`gpytorch.distributions.MultivariateNormal.rsample` on the GPU. The samples are returned in the dtype
+    of the distribution. The root decomposition itself, as well as `log_prob`, are always computed in full precision.
+    Pros: faster sampling with large covariance roots on GPUs with bfloat16 support
+    Cons: less accurate samples
+    """
+
+    _state = False
+
+
+class cholesky_block_size(_value_context):
+    """
+    If set, matrices larger than this size are Cholesky-factorized with a blocked (right-looking)
+    algorithm that uses diagonal blocks of this size (see :func:`gpytorch.utils.cholesky.blocked_cholesky`).
+    This can be faster than monolithic Cholesky routines for very large matrices on the GPU.
+    If None, matrices are always factorized with `torch.cholesky`.
+    Default: None
+    """
+
+    _global_value = None
+
+
+class cholesky_device(_value_context):
+    """
+    The device on which to compute Cholesky decompositions (e.g. `"cpu"`). The factor is moved back to the
+    device of the original matrix. If None, small batches of CUDA matrices (less than 32 x 32) are factorized
+    on the CPU, and all other matrices are factorized on their own device.
+    Default: None
+    """
+
+    _global_value = None
+
+
 class max_cholesky_size(_value_context):
     """
     If the size of of a LazyTensor is less than `max_cholesky_size`,
@@ -394,6 +429,19 @@ class max_lanczos_quadrature_iterations(_value_context):
     _global_value = 20
 
 
+class memory_efficient_covariance(_feature_flag):
+    """
+    Whether or not lazy :obj:`gpytorch.distributions.MultivariateNormal` distributions should hold on to
+    their dense `covariance_matrix`. If set to True, the distribution only keeps a weak reference to the
+    dense matrix. Covariances that are stored as a :obj:`gpytorch.lazy.CholLazyTensor` are rebuilt from
+    their Cholesky factor; other covariances are evaluated (and cached, if at all, by the LazyTensor itself).
+    Pros: the distribution does not keep a dense copy of Cholesky-factored covariance matrices alive
+    Cons: repeated calls to `covariance_matrix` may recompute the matrix
+    """
+
+    _state = False
+
+
 class memory_efficient(_feature_flag):
     """
     Whether or not to use Toeplitz math with gridded data, grid inducing point modules
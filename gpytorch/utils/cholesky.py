@@ -2,6 +2,80 @@
 
 import warnings
 import torch
+from .. import settings
+
+# Batches of CUDA matrices smaller than this are factorized on the CPU, where the batched kernels are much faster
+_MAX_SMALL_BATCH_CHOLESKY_SIZE = 32
+
+
+def _cholesky_device(A):
+    """The device on which :func:`_cholesky` factorizes A (see :class:`gpytorch.settings.cholesky_device`)"""
+    device = settings.cholesky_device.value()
+    if device is None:
+        if A.is_cuda and A.shape[:-2].numel() > 1 and A.size(-1) < _MAX_SMALL_BATCH_CHOLESKY_SIZE:
+            device = torch.device("cpu")
+        else:
+            device = A.device
+    return torch.device(device)
+
+
+def _cholesky(A, upper=False, out=None):
+    """Call torch.cholesky on the device chosen by :class:`gpytorch.settings.cholesky_device`.
+    If no device is set, small batches of CUDA matrices are factorized on the CPU.
+    Matrices larger than :class:`gpytorch.settings.cholesky_block_size` are factorized with :func:`blocked_cholesky`.
+    The result is always returned on the device of A.
+    """
+    block_size = settings.cholesky_block_size.value()
+    if block_size is not None and A.size(-1) > block_size:
+        L = blocked_cholesky(A, block_size=block_size)
+        if upper:
+            L = L.transpose(-1, -2)
+        if out is not None:
+            return out.copy_(L)
+        return L
+
+    device = _cholesky_device(A)
+    if device.type == A.device.type and (device.index is None or device.index == A.device.index):
+        return torch.cholesky(A, upper=upper, out=out)
+
+    L = torch.cholesky(A.to(device), upper=upper).to(A.device)
+    if out is not None:
+        return out.copy_(L)
+    return L
+
+
+def blocked_cholesky(A, block_size=512):
+    """Compute the (lower triangular) Cholesky decomposition of A with a blocked, right-looking algorithm.
+    Each diagonal block is factorized directly, the block below it is obtained with a triangular solve,
+    and the trailing Schur complement is updated in place (on a single copy of A).
+    Most of the work is done in triangular solves and matrix multiplies, rather than in the
+    panel factorizations used by monolithic Cholesky routines.
+    Args:
+        :attr:`A` (Tensor):
+            The (batch of) positive definite matrices to decompose
+        :attr:`block_size` (int, optional):
+            The size of the diagonal blocks (default 512)
+    """
+    n = A.size(-1)
+    if n <= block_size:
+        return _cholesky(A)
+
+    batch_shape = A.shape[:-2]
+    A = A.reshape(-1, n, n).clone()
+    L = torch.zeros_like(A)
+    for start in range(0, n, block_size):
+        end = min(start + block_size, n)
+        L11 = _cholesky(A[:, start:end, start:end])
+        L[:, start:end, start:end] = L11
+        if end < n:
+            # L21 L11^T = A21  <=>  L11 L21^T = A21^T
+            L21 = torch.triangular_solve(A[:, end:, start:end].transpose(-1, -2), L11, upper=False)[0]
+            L21 = L21.transpose(-1, -2)
+            L[:, end:, start:end] = L21
+            # A22 <- A22 - L21 L21^T
+            A[:, end:, end:].baddbmm_(L21, L21.transpose(-1, -2), alpha=-1)
+
+    return L.view(*batch_shape, n, n)
 
 
 def psd_safe_cholesky(A, upper=False, out=None, jitter=None):
@@ -18,7 +92,7 @@ def psd_safe_cholesky(A, upper=False, out=None, jitter=None):
             as 1e-6 (float) or 1e-8 (double)
     """
     try:
-        L = torch.cholesky(A, upper=upper, out=out)
+        L = _cholesky(A, upper=upper, out=out)
         return L
     except RuntimeError as e:
         if jitter is None:
@@ -30,7 +104,7 @@ def psd_safe_cholesky(A, upper=False, out=None, jitter=None):
             Aprime.diagonal(dim1=-2, dim2=-1).add_(jitter_new - jitter_prev)
             jitter_prev = jitter_new
             try:
-                L = torch.cholesky(Aprime, upper=upper, out=out)
+                L = _cholesky(Aprime, upper=upper, out=out)
                 warnings.warn(f"A not p.d., added jitter of {jitter_new} to the diagonal", RuntimeWarning)
                 return L
             except RuntimeError:
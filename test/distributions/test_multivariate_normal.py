@@ -4,13 +4,31 @@ import math
 import unittest
 
 import torch
+from gpytorch import settings
 from gpytorch.distributions import MultivariateNormal
-from gpytorch.lazy import DiagLazyTensor, LazyTensor, NonLazyTensor
+from gpytorch.lazy import CholLazyTensor, DiagLazyTensor, LazyTensor, NonLazyTensor
 from gpytorch.test.base_test_case import BaseTestCase
 from gpytorch.test.utils import least_used_cuda_device
 from torch.distributions import MultivariateNormal as TMultivariateNormal
 
 
+class _DenseLazyTensor(LazyTensor):
+    """A LazyTensor that relies on the default LazyTensor._expand_batch"""
+
+    def __init__(self, tensor):
+        super().__init__(tensor)
+        self.tensor = tensor
+
+    def _matmul(self, rhs):
+        return torch.matmul(self.tensor, rhs)
+
+    def _size(self):
+        return self.tensor.size()
+
+    def _transpose_nonbatch(self):
+        return _DenseLazyTensor(self.tensor.transpose(-1, -2))
+
+
 class TestMultivariateNormal(BaseTestCase, unittest.TestCase):
     seed = 1
 
@@ -114,6 +132,18 @@ class TestMultivariateNormal(BaseTestCase, unittest.TestCase):
             self.assertAllClose(mvn_divby2.mean, mvn.mean / 2)
             self.assertAllClose(mvn_divby2.covariance_matrix, mvn.covariance_matrix / 4)
             self.assertAllClose(mvn_divby2._unbroadcasted_scale_tril, covmat_chol / 2)
+            with settings.memory_efficient_covariance():
+                mvn_mem = MultivariateNormal(mean=mean, covariance_matrix=NonLazyTensor(covmat))
+                self.assertAllClose(mvn_mem.covariance_matrix, covmat)
+                # Singular covariances must not pick up any jitter
+                singular_covar = NonLazyTensor(torch.ones(3, 3, device=device, dtype=dtype))
+                mvn_mem = MultivariateNormal(mean=mean, covariance_matrix=singular_covar)
+                self.assertAllClose(mvn_mem.covariance_matrix, singular_covar.evaluate())
+                mvn_mem = MultivariateNormal(mean=mean, covariance_matrix=CholLazyTensor(covmat_chol))
+                self.assertAllClose(mvn_mem.covariance_matrix, covmat)
+            mvn_times0 = mvn * 0
+            self.assertAllClose(mvn_times0.mean, torch.zeros_like(mean))
+            self.assertAllClose(mvn_times0.covariance_matrix, torch.zeros_like(covmat))
             # TODO: Add tests for entropy, log_prob, etc. - this an issue b/c it
             # uses using root_decomposition which is not very reliable
             # self.assertAlmostEqual(mvn.entropy().item(), 4.3157, places=4)
@@ -189,6 +219,7 @@ class TestMultivariateNormal(BaseTestCase, unittest.TestCase):
             self.assertTrue(mvn.sample(base_samples=base_samples).shape == torch.Size([3, 4, 3]))
             base_samples = mvn.get_base_samples()
             self.assertTrue(mvn.sample(base_samples=base_samples).shape == torch.Size([3]))
+            self.assertIs(mvn.expand(torch.Size()), mvn)
 
     def test_multivariate_normal_correlated_samples_cuda(self):
         if torch.cuda.is_available():
@@ -211,6 +242,49 @@ class TestMultivariateNormal(BaseTestCase, unittest.TestCase):
             with least_used_cuda_device():
                 self.test_multivariate_normal_batch_correlated_samples(cuda=True)
 
+    def test_multivariate_normal_batch_dense_root_samples(self, cuda=False):
+        device = torch.device("cuda") if cuda else torch.device("cpu")
+        for dtype in (torch.float, torch.double):
+            mean = torch.randn(2, 3, device=device, dtype=dtype)
+            covmat = torch.randn(2, 3, 3, device=device, dtype=dtype)
+            covmat = covmat.matmul(covmat.transpose(-1, -2)) + torch.eye(3, device=device, dtype=dtype)
+            mvn = MultivariateNormal(mean=mean, covariance_matrix=NonLazyTensor(covmat))
+            for num_samples in (2, 5):
+                base_samples = mvn.get_base_samples(torch.Size([num_samples]))
+                samples = mvn.rsample(base_samples=base_samples)
+                expected = torch.cholesky(covmat).matmul(base_samples.unsqueeze(-1)).squeeze(-1) + mean
+                self.assertAllClose(samples, expected)
+
+    def test_multivariate_normal_batch_dense_root_samples_cuda(self):
+        if torch.cuda.is_available():
+            with least_used_cuda_device():
+                self.test_multivariate_normal_batch_dense_root_samples(cuda=True)
+
+    def test_bf16_sampling(self, cuda=False):
+        device = torch.device("cuda") if cuda else torch.device("cpu")
+        for dtype in (torch.float, torch.double):
+            mean = torch.tensor([0, 1, 2], device=device, dtype=dtype)
+            covmat = torch.tensor([[2, 0.5, 0.25], [0.5, 1.5, 0.5], [0.25, 0.5, 1]], device=device, dtype=dtype)
+            # A batched NonLazyTensor has a dense root, so rsample takes the branch that reads the flag
+            mvn = MultivariateNormal(mean=mean.repeat(2, 1), covariance_matrix=NonLazyTensor(covmat.repeat(2, 1, 1)))
+            base_samples = mvn.get_base_samples(torch.Size((3, 4)))
+            samples = mvn.rsample(base_samples=base_samples)
+            with settings.bf16_sampling(True):
+                bf16_samples = mvn.rsample(base_samples=base_samples)
+            self.assertEqual(bf16_samples.dtype, dtype)
+            self.assertEqual(bf16_samples.shape, torch.Size([3, 4, 2, 3]))
+            if cuda:
+                # bfloat16 only keeps ~3 significant digits
+                self.assertAllClose(bf16_samples, samples, rtol=5e-2, atol=1e-1)
+            else:
+                # The flag is a no-op on the CPU
+                self.assertTrue(torch.equal(bf16_samples, samples))
+
+    def test_bf16_sampling_cuda(self):
+        if torch.cuda.is_available():
+            with least_used_cuda_device():
+                self.test_bf16_sampling(cuda=True)
+
     def test_log_prob(self, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
         for dtype in (torch.float, torch.double):
@@ -232,6 +306,23 @@ class TestMultivariateNormal(BaseTestCase, unittest.TestCase):
             ).log_prob(values)
             self.assertLess((res - actual).div(res).abs().norm(), 1e-2)
 
+    def test_log_prob_batch_value_non_batch_covar(self, cuda=False):
+        device = torch.device("cuda") if cuda else torch.device("cpu")
+        for dtype in (torch.float, torch.double):
+            mean = torch.randn(4, device=device, dtype=dtype)
+            var = torch.randn(4, device=device, dtype=dtype).abs_().add_(0.5)
+            values = torch.randn(3, 4, device=device, dtype=dtype)
+
+            res = MultivariateNormal(mean, _DenseLazyTensor(var.diag())).log_prob(values)
+            actual = TMultivariateNormal(mean, var.diag()).log_prob(values)
+            self.assertEqual(res.shape, torch.Size([3]))
+            self.assertAllClose(res, actual, rtol=1e-3, atol=1e-3)
+
+    def test_log_prob_batch_value_non_batch_covar_cuda(self):
+        if torch.cuda.is_available():
+            with least_used_cuda_device():
+                self.test_log_prob_batch_value_non_batch_covar(cuda=True)
+
     def test_log_prob_cuda(self):
         if torch.cuda.is_available():
             with least_used_cuda_device():
@@ -261,6 +352,18 @@ class TestMultivariateNormal(BaseTestCase, unittest.TestCase):
             actual = 0.5 * (8 - 4 + 4 * math.exp(-2))
             self.assertLess((res - actual).div(res).abs().item(), 1e-2)
 
+            # Dense covariance (Cholesky path with separate solves)
+            dist_e = MultivariateNormal(mean0, _DenseLazyTensor(var1.diag()))
+            res = torch.distributions.kl.kl_divergence(dist_a, dist_e)
+            actual = 0.5 * (8 - 4 + 4 * math.exp(-2))
+            self.assertLess((res - actual).div(res).abs().item(), 1e-2)
+
+            # Shared covariance LazyTensor
+            dist_d = MultivariateNormal(mean1, dist_a.lazy_covariance_matrix)
+            res = torch.distributions.kl.kl_divergence(dist_d, dist_a)
+            actual = var0.reciprocal().sum().div(2.0)
+            self.assertLess((res - actual).div(res).abs().item(), 1e-2)
+
     def test_kl_divergence_cuda(self):
         if torch.cuda.is_available():
             with least_used_cuda_device():
@@ -2,7 +2,7 @@
 
 import torch
 import unittest
-from gpytorch.lazy import ToeplitzLazyTensor
+from gpytorch.lazy import ConstantMulLazyTensor, ToeplitzLazyTensor
 from gpytorch.utils.toeplitz import sym_toeplitz
 from gpytorch.test.lazy_tensor_test_case import LazyTensorTestCase
 
@@ -20,6 +20,13 @@ class TestConstantMulLazyTensor(LazyTensorTestCase, unittest.TestCase):
         column = lazy_tensor.base_lazy_tensor.column
         return sym_toeplitz(column) * constant
 
+    def test_nested_constant_mul(self):
+        lazy_tensor = self.create_lazy_tensor()
+        res = lazy_tensor * 2.0
+        self.assertIsInstance(res, ConstantMulLazyTensor)
+        self.assertIsInstance(res.base_lazy_tensor, ToeplitzLazyTensor)
+        self.assertTrue(torch.allclose(res.evaluate(), lazy_tensor.evaluate() * 2.0))
+
 
 class TestConstantMulLazyTensorBatch(LazyTensorTestCase, unittest.TestCase):
     seed = 0
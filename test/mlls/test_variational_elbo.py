@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import unittest
+
+import gpytorch
+import torch
+from gpytorch.likelihoods import GaussianLikelihood
+from gpytorch.models import AbstractVariationalGP
+from gpytorch.priors import GammaPrior, NormalPrior
+from gpytorch.test.base_test_case import BaseTestCase
+from gpytorch.test.utils import least_used_cuda_device
+from gpytorch.variational import CholeskyVariationalDistribution, VariationalStrategy
+
+
+class SVGPModelWithPriors(AbstractVariationalGP):
+    def __init__(self, inducing_points):
+        variational_distribution = CholeskyVariationalDistribution(inducing_points.size(-2))
+        variational_strategy = VariationalStrategy(self, inducing_points, variational_distribution)
+        super(SVGPModelWithPriors, self).__init__(variational_strategy)
+        self.mean_module = gpytorch.means.ConstantMean(prior=NormalPrior(0.5, 2.0))
+        self.covar_module = gpytorch.kernels.ScaleKernel(
+            gpytorch.kernels.RBFKernel(
+                ard_num_dims=2,
+                # loc/scale broadcast against the 1 x 2 lengthscale
+                lengthscale_prior=NormalPrior(torch.tensor([0.0, 1.0]), torch.tensor(1.5)),
+            ),
+            outputscale_prior=NormalPrior(0.0, 1.0, transform=torch.log),
+        )
+
+    def forward(self, x):
+        mean_x = self.mean_module(x)
+        covar_x = self.covar_module(x)
+        return gpytorch.distributions.MultivariateNormal(mean_x, covar_x)
+
+
+class TestVariationalELBO(BaseTestCase, unittest.TestCase):
+    seed = 0
+
+    def test_prior_log_probs(self, cuda=False):
+        device = torch.device("cuda") if cuda else torch.device("cpu")
+        train_x = torch.rand(20, 2, device=device)
+        train_y = torch.sin(train_x.sum(-1))
+
+        # GammaPrior is not vectorized with the NormalPriors
+        likelihood = GaussianLikelihood(noise_prior=GammaPrior(1.1, 0.05)).to(device)
+        model = SVGPModelWithPriors(torch.rand(5, 2)).to(device)
+        model.train()
+        likelihood.train()
+
+        mll = gpytorch.mlls.VariationalELBO(likelihood, model, num_data=train_y.size(0), combine_terms=False)
+        named_priors = list(mll.named_priors())
+        self.assertEqual(sum(isinstance(prior, NormalPrior) for _, prior, _, _ in named_priors), 3)
+        self.assertEqual(sum(isinstance(prior, GammaPrior) for _, prior, _, _ in named_priors), 1)
+
+        expected_log_prior = sum(prior.log_prob(closure()).sum() for _, prior, closure, _ in named_priors)
+        output = model(train_x)
+        log_likelihood, kl_divergence, log_prior = mll(output, train_y)
+        self.assertAllClose(log_prior, expected_log_prior / train_y.size(0))
+
+        mll.combine_terms = True
+        res = mll(output, train_y)
+        self.assertAllClose(res, log_likelihood - kl_divergence + log_prior)
+
+        # Gradients flow back to each hyperparameter through the vectorized computation
+        res.backward()
+        self.assertIsNotNone(model.mean_module.constant.grad)
+        self.assertIsNotNone(model.covar_module.raw_outputscale.grad)
+        self.assertIsNotNone(model.covar_module.base_kernel.raw_lengthscale.grad)
+
+    def test_prior_log_probs_cuda(self):
+        if torch.cuda.is_available():
+            with least_used_cuda_device():
+                self.test_prior_log_probs(cuda=True)
+
+    def test_prior_log_probs_mixed_dtype(self):
+        likelihood = GaussianLikelihood(noise_prior=GammaPrior(1.1, 0.05))
+        model = SVGPModelWithPriors(torch.rand(5, 2))
+        model.mean_module.double()
+        mll = gpytorch.mlls.VariationalELBO(likelihood, model, num_data=20)
+
+        # The double NormalPrior is grouped separately, and every group is reduced to a scalar
+        prior_log_probs = mll._prior_log_probs()
+        self.assertEqual(len(prior_log_probs), 3)
+        self.assertEqual({log_prob.dtype for log_prob in prior_log_probs}, {torch.float, torch.double})
+        self.assertTrue(all(log_prob.dim() == 0 for log_prob in prior_log_probs))
+
+        expected_log_prior = sum(prior.log_prob(closure()).sum().item() for _, prior, closure, _ in mll.named_priors())
+        self.assertAlmostEqual(sum(log_prob.item() for log_prob in prior_log_probs), expected_log_prior, places=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
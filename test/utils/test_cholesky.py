@@ -4,7 +4,13 @@ import unittest
 import warnings
 
 import torch
-from gpytorch.utils.cholesky import psd_safe_cholesky
+from gpytorch import settings
+from gpytorch.utils.cholesky import (
+    _MAX_SMALL_BATCH_CHOLESKY_SIZE,
+    _cholesky_device,
+    blocked_cholesky,
+    psd_safe_cholesky,
+)
 from gpytorch.test.utils import least_used_cuda_device
 
 
@@ -84,6 +90,58 @@ class TestPSDSafeCholesky(unittest.TestCase):
             with least_used_cuda_device():
                 self.test_psd_safe_cholesky_psd(cuda=True)
 
+    def test_psd_safe_cholesky_device(self, cuda=False):
+        device = torch.device("cuda") if cuda else torch.device("cpu")
+        other_device = torch.device("cpu") if cuda else torch.device("cuda")
+        for dtype in (torch.float, torch.double):
+            A = self._gen_test_psd().to(device=device, dtype=dtype)
+            A += torch.eye(2).type_as(A)
+            L = torch.cholesky(A)
+
+            # Dispatch decision: small batches of CUDA matrices go to the CPU, everything else stays put
+            self.assertEqual(_cholesky_device(A).type, "cpu")
+            self.assertEqual(_cholesky_device(A[0]).type, device.type)
+            large_A = torch.eye(_MAX_SMALL_BATCH_CHOLESKY_SIZE, device=device, dtype=dtype).repeat(2, 1, 1)
+            self.assertEqual(_cholesky_device(large_A).type, device.type)
+            with settings.cholesky_device(other_device):
+                self.assertEqual(_cholesky_device(A), other_device)
+                self.assertEqual(_cholesky_device(large_A), other_device)
+            with settings.cholesky_device(device):
+                self.assertEqual(_cholesky_device(A).type, device.type)
+
+            for cholesky_device in (device, other_device):
+                if cholesky_device.type == "cuda" and not torch.cuda.is_available():
+                    continue
+                # Factorizing on another device round trips the result back to the device of A
+                with settings.cholesky_device(cholesky_device):
+                    L_safe = psd_safe_cholesky(A)
+                    L_safe_upper = psd_safe_cholesky(A, upper=True)
+                self.assertEqual(L_safe.device, A.device)
+                self.assertTrue(torch.allclose(L, L_safe))
+                self.assertTrue(torch.allclose(L.transpose(-1, -2), L_safe_upper))
+
+    def test_psd_safe_cholesky_device_cuda(self, cuda=False):
+        if torch.cuda.is_available():
+            with least_used_cuda_device():
+                self.test_psd_safe_cholesky_device(cuda=True)
+
+    def test_blocked_cholesky(self, cuda=False):
+        device = torch.device("cuda") if cuda else torch.device("cpu")
+        for dtype in (torch.float, torch.double):
+            for shape in (torch.Size([10, 10]), torch.Size([2, 10, 10]), torch.Size([2, 3, 10, 10])):
+                A = torch.randn(*shape, device=device, dtype=dtype)
+                A = A.matmul(A.transpose(-1, -2)) + 10 * torch.eye(10, device=device, dtype=dtype)
+                L = torch.cholesky(A)
+                self.assertTrue(torch.allclose(blocked_cholesky(A, block_size=3), L, atol=1e-4))
+                with settings.cholesky_block_size(4):
+                    self.assertTrue(torch.allclose(psd_safe_cholesky(A), L, atol=1e-4))
+                    self.assertTrue(torch.allclose(psd_safe_cholesky(A, upper=True), L.transpose(-1, -2), atol=1e-4))
+
+    def test_blocked_cholesky_cuda(self, cuda=False):
+        if torch.cuda.is_available():
+            with least_used_cuda_device():
+                self.test_blocked_cholesky(cuda=True)
+
 
 if __name__ == "__main__":
     unittest.main()